@@ -1 +1 @@
-from .main import analyze
+from .main import analyze, analyze_chunks
@@ -1,10 +1,151 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from functools import wraps
 
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
-import seaborn as sns
-from loguru import logger
+
+# matplotlib, seaborn and loguru are imported on first use: they dominate the
+# import time of snax.analyze and most callers never draw a plot.
+
+
+MAX_HIST_BINS = 50
+# Streamed columns keep exact value counts up to MAX_DISTINCT distinct values;
+# numerical columns beyond that are sketched into SKETCH_BINS fixed-width bins.
+MAX_DISTINCT = 50_000
+SKETCH_BINS = 1_000  # must be even, bins are merged in pairs
+
+
+@dataclass(frozen=True, eq=False)
+class Histogram:
+    """Precomputed histogram aggregate of a single column.
+
+    Continuous columns are binned (index holds the left bin edges), discrete codes
+    and categories are counted per value. Both the null-free and the null-including
+    counts are kept, so toggling nulls never rescans the series.
+    """
+
+    key: str
+    counts: pd.Series
+    counts_with_nulls: pd.Series
+    null_count: int
+    is_binned: bool
+
+    @property
+    def total(self) -> int:
+        return int(self.counts.sum()) + self.null_count
+
+    def to_series(self, dropna: bool = True) -> pd.Series:
+        return self.counts if dropna else self.counts_with_nulls
+
+    def to_dict(self):
+        return {
+            "key": self.key,
+            "bins": self.counts.index.tolist(),
+            "counts": self.counts.tolist(),
+            "null_count": self.null_count,
+            "is_binned": self.is_binned,
+        }
+
+
+def _is_continuous(values, max_bins: int) -> bool:
+    return (
+        pd.api.types.is_numeric_dtype(values)
+        and not pd.api.types.is_bool_dtype(values)
+        and len(values) > max_bins
+    )
+
+
+def _bin(values: np.ndarray, weights, bins) -> pd.Series:
+    """Bin the finite ``values``; -inf and inf get bars of their own."""
+    finite = np.isfinite(values)
+    counts, edges = np.histogram(
+        values[finite], bins=bins, weights=None if weights is None else weights[finite]
+    )
+    counts = pd.Series(counts, index=edges[:-1])
+    for label in (-np.inf, np.inf):
+        mask = values == label
+        count = mask.sum() if weights is None else weights[mask].sum()
+        if count:
+            counts[label] = count
+    return counts
+
+
+def histogram(key: str, series: pd.Series, max_bins: int = MAX_HIST_BINS) -> Histogram:
+    values = series.dropna()
+    null_count = len(series) - len(values)
+
+    if _is_continuous(values.unique(), max_bins):
+        values = values.to_numpy(dtype="float64")
+        finite = values[np.isfinite(values)]
+        edges = np.histogram_bin_edges(finite, bins="auto")
+        if len(edges) - 1 > max_bins:
+            edges = np.histogram_bin_edges(finite, bins=max_bins)
+        return _histogram(key, _bin(values, None, edges), null_count, True, max_bins)
+    return _histogram(key, values.value_counts(), null_count, False, max_bins)
+
+
+def histogram_from_counts(
+    key: str,
+    value_counts: pd.Series,
+    null_count: int = 0,
+    max_bins: int = MAX_HIST_BINS,
+) -> Histogram:
+    """Histogram of a column known only by its value counts (e.g. a streamed file).
+
+    Continuous columns get ``max_bins`` equal-width bins, as automatic bin width
+    estimation is not available for weighted data.
+    """
+    if _is_continuous(value_counts.index, max_bins):
+        counts = _bin(
+            value_counts.index.to_numpy(dtype="float64"),
+            value_counts.to_numpy(),
+            max_bins,
+        )
+        return _histogram(key, counts, null_count, True, max_bins)
+    return _histogram(key, value_counts, null_count, False, max_bins)
+
+
+def _histogram(
+    key: str, counts: pd.Series, null_count: int, is_binned: bool, max_bins: int
+) -> Histogram:
+    if is_binned or pd.api.types.is_numeric_dtype(counts.index):
+        counts = counts.sort_index()
+    else:
+        counts = counts.sort_values(ascending=False)
+        if len(counts) > max_bins:
+            # Keep the chart payload bounded: fold the long tail into one bar.
+            head = counts.iloc[: max_bins - 1]
+            tail = pd.Series([counts.iloc[max_bins - 1 :].sum()], index=["Other"])
+            counts = pd.concat([head, tail])
+    counts = counts.astype("int64").rename("count").rename_axis(key)
+
+    counts_with_nulls = counts
+    if null_count:
+        counts_with_nulls = pd.concat(
+            [counts, pd.Series([null_count], index=[np.nan], name="count")]
+        ).rename_axis(key)
+
+    return Histogram(
+        key=key,
+        counts=counts,
+        counts_with_nulls=counts_with_nulls,
+        null_count=int(null_count),
+        is_binned=is_binned,
+    )
+
+
+def _weighted_quantile(values, weights, q):
+    """Quantiles of sorted ``values`` each repeated ``weights`` times.
+
+    Interpolates linearly, like ``Series.quantile``.
+    """
+    values = np.asarray(values, dtype="float64")
+    cumulative = np.cumsum(np.asarray(weights))
+    position = np.asarray(q, dtype="float64") * (cumulative[-1] - 1)
+    lower = values[np.searchsorted(cumulative, np.floor(position), side="right")]
+    upper = values[np.searchsorted(cumulative, np.ceil(position), side="right")]
+    return lower + (upper - lower) * (position - np.floor(position))
 
 
 class Component:
@@ -23,6 +164,8 @@ class Component:
         "null_count",
         "non_null_count",
         "value_counts",
+        "histograms",
+        "weights",
     )
 
     def __init__(self, key: str, series):
@@ -41,12 +184,50 @@ class Component:
         self.null_count = None
         self.non_null_count = None
         self.value_counts = None
+        self.histograms: dict[int, Histogram] = {}
+        self.weights = None
+
+    @classmethod
+    def from_value_counts(cls, key: str, value_counts: pd.Series, null_count: int = 0):
+        """Build a processed component from merged value counts.
+
+        Used when a column is streamed in chunks and never held in memory whole:
+        ``series`` then holds the distinct values and ``weights`` their counts.
+        ``quantiles()`` and ``hist()`` honor the weights, ``sample()`` and
+        ``boxplot()`` raise.
+        """
+        numeric = pd.api.types.is_numeric_dtype(value_counts.index)
+        if numeric:
+            value_counts = value_counts.sort_index()
+        else:
+            value_counts = value_counts.sort_values(ascending=False)
+        value_counts = value_counts.astype("int64")
+        component = cls(key, pd.Series(value_counts.index, name=key))
+        component.weights = pd.Series(value_counts.to_numpy(), name="count")
+        component.unique = len(value_counts)
+        component.null_count = int(null_count)
+        component.non_null_count = int(value_counts.sum())
+
+        if component.is_numerical and component.non_null_count:
+            values = value_counts.index.to_numpy()
+            weights = value_counts.to_numpy()
+            component.min = values[0]
+            component.max = values[-1]
+            component.mean = np.average(values.astype("float64"), weights=weights)
+            component.median = _weighted_quantile(values, weights, 0.5)
+            component.nunique = component.unique
+
+        if component.is_categorical:
+            component.value_counts = value_counts
+        return component
 
     def __repr__(self):
         return f"Component(key={self.key!r}, is_numerical={self.is_numerical}, is_categorical={self.is_categorical})"
 
     def quantiles(self, q=[0.25, 0.5, 0.75]):
-        if self.is_numerical:
+        if self.is_numerical and self.weights is not None:
+            return pd.Series(_weighted_quantile(self.series, self.weights, q), index=q)
+        elif self.is_numerical:
             return self.series.quantile(q)
         else:
             raise ValueError("Quantiles can only be computed for numerical components.")
@@ -71,6 +252,8 @@ class Component:
 
     def process(self):
         if self.is_procesed:
+            from loguru import logger
+
             logger.debug(f"Component {self.key} already processed.")
             return
         self.unique = self.series.nunique(dropna=True)
@@ -87,16 +270,41 @@ class Component:
         if self.is_categorical:
             self.value_counts = self.series.value_counts(dropna=True)
 
+    def histogram(self, max_bins: int = MAX_HIST_BINS) -> Histogram:
+        if max_bins not in self.histograms:
+            if self.weights is not None:
+                counts = pd.Series(self.weights.to_numpy(), index=self.series)
+                self.histograms[max_bins] = histogram_from_counts(
+                    self.key, counts, self.null_count, max_bins
+                )
+            else:
+                self.histograms[max_bins] = histogram(self.key, self.series, max_bins)
+        return self.histograms[max_bins]
+
     def hist(self, bins=10):
+        import seaborn as sns
+
+        if self.weights is not None:
+            if self.is_numerical:
+                sns.histplot(x=self.series, weights=self.weights, bins=bins)
+            elif self.is_categorical:
+                sns.barplot(x=self.weights, y=self.series.astype(str), orient="h")
+            return
         if self.is_numerical:
             sns.histplot(self.series.dropna(), bins=bins)
         elif self.is_categorical:
             sns.countplot(y=self.series.dropna())
 
     def sample(self, n=5):
+        if self.weights is not None:
+            raise ValueError("Streamed components hold no rows to sample.")
         return self.series.sample(n)
 
     def boxplot(self):
+        import seaborn as sns
+
+        if self.weights is not None:
+            raise ValueError("Boxplots are not supported for streamed components.")
         if self.is_numerical:
             sns.boxplot(x=self.series.dropna())
 
@@ -141,6 +349,8 @@ class ComponentContainer:
 def mutated(method):
     @wraps(method)
     def wrapper(self, *args, **kwargs):
+        from loguru import logger
+
         logger.info(f"Method {method.__name__} returns new DataExplorer instance.")
         result = method(self, *args, **kwargs)
 
@@ -158,7 +368,9 @@ class BaseExplorer(ABC):
 class PlottingMixin:
     components: ComponentContainer
 
-    def histgrid(self, bins=10, numerical_only: bool = False):
+    def histgrid(self, bins=10, numerical_only: bool = False, path=None):
+        import matplotlib.pyplot as plt
+
         n_components = len(self.components)
         n_cols = 3
         n_rows = (n_components + n_cols - 1) // n_cols
@@ -171,9 +383,15 @@ class PlottingMixin:
             component.hist(bins=bins)
             plt.title(f"Histogram of {key}")
         plt.tight_layout()
-        plt.show()
+        if path is None:
+            plt.show()
+        else:
+            plt.savefig(path)
+            plt.close()
+
+    def boxgrid(self, numerical_only: bool = False, path=None):
+        import matplotlib.pyplot as plt
 
-    def boxgrid(self, numerical_only: bool = False):
         n_components = len(self.components)
         n_cols = 3
         n_rows = (n_components + n_cols - 1) // n_cols
@@ -186,7 +404,11 @@ class PlottingMixin:
             component.boxplot()
             plt.title(f"Boxplot of {key}")
         plt.tight_layout()
-        plt.show()
+        if path is None:
+            plt.show()
+        else:
+            plt.savefig(path)
+            plt.close()
 
 
 class DataFrameExplorer(PlottingMixin, BaseExplorer):
@@ -227,3 +449,164 @@ def analyze(data):
     if not isinstance(data, pd.DataFrame):
         raise ValueError("Input data must be a pandas DataFrame.")
     return DataFrameExplorer(data).analyze()
+
+
+class _ColumnAccumulator:
+    """Streaming statistics of a single column.
+
+    Per-chunk value counts are buffered and merged once their total size passes
+    ``max_distinct``. A merged result larger than that switches a numerical
+    column to a sketch (exact count, sum, min and max plus a fixed-width
+    histogram whose range doubles, merging bin pairs, to cover new values) and
+    drops the counts of any other column.
+
+    ``read_csv`` infers dtypes per chunk, so once any chunk of a column is not
+    numerical, all its values are counted as strings, as a whole-file read does.
+    """
+
+    def __init__(self, key: str, max_distinct: int):
+        self.key = key
+        self.max_distinct = max_distinct
+        self.empty = None
+        self.null_count = 0
+        self.total = 0
+        self.pending: list[pd.Series] = []
+        self.pending_size = 0
+        self.counts = None
+        self.capped = False
+        self.edges = None
+        self.bins = None
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+        self.as_text = False
+
+    def update(self, series: pd.Series):
+        if self.empty is None:
+            self.empty = series.iloc[:0]
+        values = series.dropna()
+        self.null_count += len(series) - len(values)
+        self.total += len(values)
+        if len(values) and not pd.api.types.is_numeric_dtype(values):
+            if not self.as_text:
+                self._to_text(series.iloc[:0])
+        elif self.as_text:
+            values = values.astype(str)
+        if self.edges is not None:
+            self._sketch(values.to_numpy(dtype="float64"))
+        elif not self.capped:
+            value_counts = values.value_counts()
+            self.pending.append(value_counts)
+            self.pending_size += len(value_counts)
+            if self.pending_size > self.max_distinct:
+                self._merge()
+
+    def _to_text(self, empty: pd.Series):
+        self.as_text = True
+        self.empty = empty
+        if self.edges is not None:
+            self.edges = self.bins = self.min = self.max = None
+            self.capped = True
+        self.pending = [
+            counts.set_axis(counts.index.astype(str)) for counts in self.pending
+        ]
+        if self.counts is not None:
+            self.counts = self.counts.set_axis(self.counts.index.astype(str))
+
+    def _merge(self):
+        parts = self.pending if self.counts is None else [self.counts, *self.pending]
+        counts = pd.concat(parts).groupby(level=0, sort=False).sum()
+        self.pending, self.pending_size = [], 0
+        if len(counts) <= self.max_distinct:
+            self.counts = counts
+            return
+        self.counts = None
+        index = counts.index
+        if pd.api.types.is_numeric_dtype(index) and not (
+            pd.api.types.is_bool_dtype(index)
+        ):
+            values = index.to_numpy(dtype="float64")
+            weights = counts.to_numpy()
+            finite = values[np.isfinite(values)]
+            self.min, self.max = values.min(), values.max()
+            self.sum = float(np.dot(values, weights))
+            self.edges = np.linspace(finite.min(), finite.max(), SKETCH_BINS + 1)
+            self.bins = np.histogram(
+                self._clip(values), bins=self.edges, weights=weights
+            )[0]
+        else:
+            self.capped = True
+
+    def _clip(self, values):
+        # Only -inf and inf fall outside the edges; they go to the outermost bins.
+        return np.clip(values, self.edges[0], self.edges[-1])
+
+    def _widen(self, low: float, high: float):
+        """Double the sketch range until it covers ``[low, high]``."""
+        while low < self.edges[0] or high > self.edges[-1]:
+            start, stop = self.edges[0], self.edges[-1]
+            width = stop - start
+            merged = self.bins.reshape(-1, 2).sum(axis=1)
+            self.bins = np.zeros_like(self.bins)
+            if low < start:
+                self.bins[len(merged) :] = merged
+                start -= width
+            else:
+                self.bins[: len(merged)] = merged
+                stop += width
+            self.edges = np.linspace(start, stop, SKETCH_BINS + 1)
+
+    def _sketch(self, values):
+        if not len(values):
+            return
+        self.sum += float(values.sum())
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        finite = values[np.isfinite(values)]
+        if len(finite):
+            self._widen(finite.min(), finite.max())
+        self.bins += np.histogram(self._clip(values), bins=self.edges)[0]
+
+    def component(self) -> "Component":
+        if self.pending:
+            self._merge()
+        if self.counts is not None:
+            return Component.from_value_counts(self.key, self.counts, self.null_count)
+
+        if self.edges is not None:
+            midpoints = (self.edges[:-1] + self.edges[1:]) / 2
+            counts = pd.Series(self.bins, index=midpoints)
+            component = Component.from_value_counts(
+                self.key, counts[counts > 0], self.null_count
+            )
+            component.min, component.max = self.min, self.max
+            component.mean = self.sum / self.total
+        else:
+            component = Component(self.key, self.empty)
+            component.weights = pd.Series([], dtype="int64", name="count")
+            component.null_count = self.null_count
+            component.non_null_count = self.total
+        component.unique = component.nunique = None
+        return component
+
+
+def analyze_chunks(chunks, max_distinct: int = MAX_DISTINCT) -> ComponentContainer:
+    """Profile an iterable of DataFrame chunks without holding the whole frame.
+
+    Columns with up to ``max_distinct`` distinct values get exact statistics.
+    Beyond that, numerical columns keep exact min, max and mean but an
+    approximate median and histogram, and other columns only their null and
+    non-null counts; ``unique`` is then ``None``. Memory per column is bounded
+    by roughly ``max_distinct`` plus one chunk.
+    """
+    accumulators: dict[str, _ColumnAccumulator] = {}
+    for chunk in chunks:
+        for column in chunk.columns:
+            if column not in accumulators:
+                accumulators[column] = _ColumnAccumulator(column, max_distinct)
+            accumulators[column].update(chunk[column])
+
+    container = ComponentContainer()
+    for accumulator in accumulators.values():
+        container.add_component(accumulator.component())
+    return container
@@ -0,0 +1,228 @@
+"""Command-line entry point.
+
+``snax profile`` profiles many CSV or binary files in parallel worker processes
+and writes one result file per input, mirroring its path below the inputs'
+common directory, e.g.::
+
+    snax profile "extracts/*.csv" -o profiles/ --format json --plots
+"""
+
+import argparse
+import glob
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+
+CSV_EXTENSIONS = (".csv", ".tsv", ".txt")
+FORMATS = ("json", "csv", "parquet")
+STATS = ("min", "max", "mean", "median")
+
+
+@dataclass(frozen=True)
+class ProfileResult:
+    source: Path
+    target: Path
+    columns: int
+    rows: int
+    seconds: float
+
+
+def expand_inputs(patterns: list[str]) -> list[Path]:
+    """Expand files and glob patterns, keeping order and dropping duplicates."""
+    paths: dict[Path, None] = {}
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) or [pattern]
+        for match in matches:
+            paths.setdefault(Path(match), None)
+    return list(paths)
+
+
+def output_stems(paths: list[Path], output: Path) -> dict[Path, Path]:
+    """Map each input to its output stem, mirroring its path below the inputs'
+    common directory so same-named files from different directories stay apart.
+
+    :raises ValueError: If two inputs still map to the same stem.
+    """
+    if not paths:
+        return {}
+    root = Path(os.path.commonpath([path.resolve().parent for path in paths]))
+    stems = {
+        path: output / path.resolve().relative_to(root).with_suffix("")
+        for path in paths
+    }
+    seen: dict[Path, Path] = {}
+    for path, stem in stems.items():
+        if stem in seen:
+            raise ValueError(f"{seen[stem]} and {path} both write to {stem}.*")
+        seen[stem] = path
+    return stems
+
+
+def _read(path: Path, chunksize: int):
+    import pandas as pd
+
+    from snax.analyze import analyze, analyze_chunks
+
+    suffix = path.suffix.lower()
+    if suffix in CSV_EXTENSIONS:
+        sep = "\t" if suffix == ".tsv" else ","
+        with pd.read_csv(path, sep=sep, chunksize=chunksize) as chunks:
+            return analyze_chunks(chunks)
+    if suffix == ".parquet":
+        return analyze(pd.read_parquet(path)).components
+    if suffix == ".feather":
+        return analyze(pd.read_feather(path)).components
+    if suffix in (".pkl", ".pickle"):
+        return analyze(pd.read_pickle(path)).components
+    raise ValueError(f"Unsupported file type: {path.suffix!r}")
+
+
+def _jsonable(value):
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+def _finite(value):
+    """Map NaN and ±inf to ``None`` so the JSON output stays strict."""
+    if hasattr(value, "item"):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def profile_file(
+    path: Path, stem: Path, fmt: str, chunksize: int, plots: bool
+) -> ProfileResult:
+    """Profile a single file and write its ``ComponentContainer`` next to ``stem``."""
+    start = time.perf_counter()
+    components = _read(path, chunksize)
+    stem.parent.mkdir(parents=True, exist_ok=True)
+    target = stem.with_name(f"{stem.name}.profile.{fmt}")
+
+    if fmt == "json":
+        data = [
+            {key: _finite(value) for key, value in component.to_dict().items()}
+            for component in components.to_list()
+        ]
+        with open(target, "w") as f:
+            json.dump(
+                {"source": str(path), "components": data},
+                f,
+                default=_jsonable,
+                allow_nan=False,
+            )
+    else:
+        frame = components.to_pandas()
+        # Object columns mixing numpy bools and ints cannot be written by pyarrow.
+        for column in STATS:
+            frame[column] = frame[column].astype("float64")
+        for column in ("unique", "nunique"):
+            frame[column] = frame[column].astype("Int64")
+        frame["value_counts"] = frame["value_counts"].map(
+            lambda counts: (
+                None if counts is None else json.dumps(counts, default=_jsonable)
+            )
+        )
+        if fmt == "csv":
+            frame.to_csv(target, index=False)
+        else:
+            frame.to_parquet(target, index=False)
+
+    if plots and len(components):
+        import matplotlib
+
+        from snax.analyze.main import PlottingMixin
+
+        matplotlib.use("Agg")
+        grid = PlottingMixin()
+        grid.components = components
+        grid.histgrid(path=stem.with_name(f"{stem.name}.hist.png"))
+
+    rows = max((c.null_count + c.non_null_count for _, c in components), default=0)
+    return ProfileResult(
+        path, target, len(components), int(rows), time.perf_counter() - start
+    )
+
+
+def profile(args) -> int:
+    from loguru import logger
+
+    paths = expand_inputs(args.inputs)
+    try:
+        stems = output_stems(paths, args.output)
+    except ValueError as exc:
+        logger.error(str(exc))
+        return 2
+    failed = 0
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        futures = {
+            executor.submit(
+                profile_file, path, stem, args.format, args.chunksize, args.plots
+            ): path
+            for path, stem in stems.items()
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            path = futures[future]
+            try:
+                result = future.result()
+            except Exception as exc:
+                failed += 1
+                logger.error(f"[{done}/{len(paths)}] {path}: {exc}")
+                continue
+            logger.info(
+                f"[{done}/{len(paths)}] {path} -> {result.target} "
+                f"({result.rows} rows, {result.columns} columns, {result.seconds:.2f}s)"
+            )
+    if failed:
+        logger.warning(f"{failed} of {len(paths)} files failed.")
+    return 1 if failed else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="snax")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    parser_profile = commands.add_parser(
+        "profile", help="Profile CSV or binary files with snax.analyze."
+    )
+    parser_profile.add_argument(
+        "inputs", nargs="+", help="Files or glob patterns (quote globs)."
+    )
+    parser_profile.add_argument(
+        "-o", "--output", type=Path, default=Path("."), help="Output directory."
+    )
+    parser_profile.add_argument("-f", "--format", choices=FORMATS, default="json")
+    parser_profile.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="Number of worker processes.",
+    )
+    parser_profile.add_argument(
+        "--chunksize",
+        type=int,
+        default=100_000,
+        help="Rows per chunk when streaming CSV files.",
+    )
+    parser_profile.add_argument(
+        "--plots", action="store_true", help="Also render a histogram grid per file."
+    )
+    parser_profile.set_defaults(handler=profile)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    sys.exit(args.handler(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Import-time budgets for the public snax modules.
+
+Each module is imported in a fresh interpreter with ``python -X importtime`` and
+its cumulative import time is compared against ``BUDGETS_MS``. Heavy optional
+dependencies listed in ``DEFERRED`` must not be loaded by a plain import.
+
+Run ``python -m snax.importtime`` to check all budgets.
+"""
+
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+# Cumulative import time in milliseconds, measured cold with headroom for slower
+# machines. pandas alone accounts for most of the larger budgets.
+BUDGETS_MS: dict[str, float] = {
+    "snax.kit": 50,
+    "snax.datasets": 50,
+    "snax.ml.models.clustering": 250,
+    "snax.analyze": 1000,
+    "snax.umbd.spd.schema": 50,
+    "snax.umbd.spd.loader": 50,
+    "snax.umbd.spd.stats": 1000,
+    "snax.umbd.spd.matches": 1200,
+    "snax.umbd.spd.main": 1200,
+}
+
+DEFERRED = ("matplotlib", "seaborn", "loguru", "streamlit")
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+@dataclass(frozen=True)
+class ImportTime:
+    module: str
+    cumulative_ms: float
+    imported: frozenset[str]
+
+
+def parse(output: str, module: str) -> ImportTime:
+    """Parse ``-X importtime`` stderr for ``module``.
+
+    :param output: Raw stderr of ``python -X importtime -c "import <module>"``.
+    :param module: Dotted name of the imported module.
+    """
+    cumulative_us = None
+    imported = set()
+    for line in output.splitlines():
+        match = _LINE.match(line)
+        if match is None:
+            continue
+        _, cumulative, _, name = match.groups()
+        imported.add(name)
+        if name == module:
+            cumulative_us = int(cumulative)
+    if cumulative_us is None:
+        raise ValueError(f"Module {module!r} not found in importtime output.")
+    return ImportTime(module, cumulative_us / 1000, frozenset(imported))
+
+
+def measure(module: str) -> ImportTime:
+    # Import the snax this module belongs to, also when it is not installed.
+    root = str(Path(__file__).resolve().parents[1])
+    pythonpath = os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": pythonpath},
+    )
+    return parse(result.stderr, module)
+
+
+def check(budgets: dict[str, float] = BUDGETS_MS) -> list[str]:
+    """Return a list of budget violations, empty if every module is within budget."""
+    errors = []
+    for module, budget in budgets.items():
+        timing = measure(module)
+        if timing.cumulative_ms > budget:
+            errors.append(
+                f"{module}: {timing.cumulative_ms:.1f} ms exceeds {budget:.0f} ms"
+            )
+        loaded = [
+            dep
+            for dep in DEFERRED
+            if any(name.split(".")[0] == dep for name in timing.imported)
+        ]
+        if loaded:
+            errors.append(f"{module}: imports {', '.join(loaded)} eagerly")
+    return errors
+
+
+def main():
+    errors = check()
+    for error in errors:
+        print(error, file=sys.stderr)
+    if errors:
+        sys.exit(1)
+    print(f"{len(BUDGETS_MS)} modules within import-time budget.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,20 @@
-from snax import datasets
-from snax.analyze import analyze
+import importlib
 
 __all__ = ["analyze", "datasets"]
+
+# Resolved on first attribute access so ``import snax.kit`` stays cheap.
+_LAZY = {"analyze": ("snax.analyze", "analyze"), "datasets": ("snax.datasets", None)}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = _LAZY[name]
+    module = importlib.import_module(module_name)
+    value = getattr(module, attr) if attr else module
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,8 +1,5 @@
 from pathlib import Path
 
-
-import pandas as pd
-
 filepath = Path(__file__).parent / "data" / "speed_dating.csv"
 
 
@@ -12,4 +9,6 @@ def load_dataset():
     Returns:
         pd.DataFrame: The loaded dataset.
     """
+    import pandas as pd
+
     return pd.read_csv(filepath, sep=",", encoding="latin1")
@@ -1,60 +1,114 @@
 import pandas as pd
-import streamlit as st
 
 import snax.umbd.spd.schema as schema
-from snax.datasets import load_pandas
+import snax.umbd.spd.stats as stats
 
 
 class SPD:
 
     def __init__(self):
-        self.data = load_pandas(name="speed_dating", encoding="latin1")
         self.schema = schema
 
+    @property
+    def data(self):
+        return stats.load_data()
+
 
 def main():
     app = StreamlitApp()
+    app.style()
     app.layout()
 
 
-st.markdown(
-    """
+SIDEBAR_STYLE = """
 <style>
     section[data-testid="stSidebar"] {
         width: 600px !important;  # Change this number (e.g. 350, 450, 500)
         min-width: 400px !important;
     }
 </style>
-""",
-    unsafe_allow_html=True,
-)
+"""
+
+POLL_SECONDS = 0.5
 
 
 class StreamlitApp:
+    """Streamlit explorer for the speed dating dataset.
+
+    streamlit is imported inside the methods, so importing this module (e.g. for
+    ``SPD``) neither loads streamlit nor emits any UI.
+
+    Statistics are computed by the background ``stats.profiler()``; the page is
+    laid out from the schema alone and each panel is a fragment that fills in
+    once its results are ready, so panels also rerun independently.
+    """
+
     def __init__(self):
         self.app = SPD()
+        self.profiler = stats.profiler()
+
+    def style(self):
+        import streamlit as st
+
+        st.markdown(SIDEBAR_STYLE, unsafe_allow_html=True)
 
     # @st.cache_data
     def load_data(self):
         return self.app.data
 
-    def layout(self):
-        st.title("Speed Dating Dataset")
-        tab1, tab2 = st.tabs(["Explore", "Dataset Summary"])
-        with tab1:
-            with st.sidebar:
-                st.button("Clear Selections", on_click=lambda: st.session_state.clear())
-                columns = st.columns(len(schema.list_groups()))
-                for ix, group in enumerate(schema.list_groups()):
-                    with columns[ix]:
-                        st.write(f"**{group.value}**")
-                        for col in schema.list_by_group(group.value):
-                            st.checkbox(col.name, key=col.name)
-            cols = [
-                key
-                for key in st.session_state.keys()
-                if st.session_state[key] is True and schema.exists(key)
-            ]
+    def progressive(self, render, futures):
+        """Run ``render`` as a fragment, polling until all ``futures`` are done."""
+        import streamlit as st
+
+        pending = not all(future.done() for future in futures)
+
+        @st.fragment(run_every=POLL_SECONDS if pending else None)
+        def fragment():
+            try:
+                render()
+            finally:
+                if pending and all(future.done() for future in futures):
+                    # Full rerun re-registers the fragment without polling.
+                    st.rerun()
+
+        fragment()
+
+    @staticmethod
+    def column_row(item, future) -> dict:
+        row = {
+            "Column Name": item.name,
+            "Description": item.desc,
+            "Data Type": item.dtype,
+            "Unique Values": None,
+            "Samples": None,
+            "Min/Mean/Max": None,
+            "Num Missing": None,
+        }
+        if not future.done():
+            return row
+        if future.exception() is not None:
+            return {**row, "Samples": "N/A", "Min/Mean/Max": "N/A"}
+        result = future.result()
+        component = result.component
+        row["Unique Values"] = component.unique
+        row["Samples"] = ", ".join(map(str, result.samples))
+        row["Min/Mean/Max"] = (
+            f"{component.min}/{component.mean:.2f}/{component.max}"
+            if component.is_numerical
+            else "N/A"
+        )
+        row["Num Missing"] = component.null_count
+        return row
+
+    def columns_panel(self, cols):
+        import streamlit as st
+
+        futures = {
+            item.name: self.profiler.column(item.name)
+            for item in self.app.schema.to_list()
+        }
+
+        def render():
             search_term = st.text_input("Search columns", "", key="live_search")
             st.write("### Columns")
             items = self.app.schema.to_list()
@@ -69,39 +123,121 @@ class StreamlitApp:
                 st.write(f"Found {len(items)} matching columns")
 
             df = pd.DataFrame(
-                {
-                    "Column Name": [item.name for item in items],
-                    "Description": [item.desc for item in items],
-                    "Data Type": [item.dtype for item in items],
-                    "Unique Values": [
-                        self.app.data[item.name].nunique() for item in items
-                    ],
-                    "Samples": [
-                        ", ".join(
-                            map(
-                                str,
-                                self.app.data[item.name].dropna().unique()[:5].tolist(),
-                            )
-                        )
-                        for item in items
-                    ],
-                    "Min/Mean/Max": [
-                        (
-                            f"{self.app.data[item.name].min()}/{self.app.data[item.name].mean():.2f}/{self.app.data[item.name].max()}"
-                            if pd.api.types.is_numeric_dtype(self.app.data[item.name])
-                            else "N/A"
-                        )
-                        for item in items
-                    ],
-                    "Num Missing": [
-                        self.app.data[item.name].isna().sum() for item in items
-                    ],
-                }
+                [self.column_row(item, futures[item.name]) for item in items]
             )
             if cols:
                 df = df[df["Column Name"].isin(cols)]
 
+            done = sum(future.done() for future in futures.values())
+            if done < len(futures):
+                st.progress(
+                    done / len(futures), text=f"Profiled {done}/{len(futures)} columns"
+                )
             st.dataframe(df, use_container_width=True)
+
+        self.progressive(render, list(futures.values()))
+
+    def histogram_panel(self, col):
+        import streamlit as st
+
+        try:
+            colname = schema.get_col_by_name(col).desc
+        except AttributeError:
+            colname = "N/A"
+        st.write(f"#### {col} ({colname})")
+        future = self.profiler.histogram(col)
+
+        def render():
+            if not future.done():
+                st.caption("Profiling...")
+                return
+            if future.exception() is not None:
+                st.caption("N/A")
+                return
+            hist = future.result()
+            missing_count = hist.null_count
+            total_count = hist.total
+            bc1, bc2, bc3 = st.columns(3)
+            with bc1:
+                st.badge(f"Missing: {missing_count}", color="red")
+            with bc2:
+                st.badge(f"Total: {total_count}", color="blue")
+            with bc3:
+                st.badge(
+                    f"Missing %: {missing_count / total_count * 100:.2f}%",
+                    color="orange",
+                )
+            drop_nulls = st.checkbox("Drop Nulls", value=True, key=f"drop_nulls_{col}")
+            st.write(drop_nulls)
+            bar_chart_data = hist.to_series(dropna=drop_nulls)
+            st.write(bar_chart_data)
+            st.bar_chart(bar_chart_data, use_container_width=True)
+
+        self.progressive(render, [future])
+
+    def correlation_panel(self, cols):
+        import streamlit as st
+
+        future = self.profiler.correlation(cols)
+
+        def render():
+            if not future.done():
+                st.caption("Computing correlations...")
+                return
+            if future.exception() is not None:
+                st.caption("N/A")
+                return
+            st.dataframe(
+                future.result().style.background_gradient(cmap="coolwarm"),
+                use_container_width=True,
+            )
+
+        self.progressive(render, [future])
+
+    def summary_panel(self):
+        import streamlit as st
+
+        data = self.profiler.data()
+        waves = self.profiler.waves()
+
+        def render():
+            st.write("### Data Types")
+            if not data.done():
+                st.caption("Loading data...")
+            elif data.exception() is not None:
+                st.caption("N/A")
+            else:
+                st.dataframe(data.result().dtypes)
+            st.write("### Waves")
+            if not waves.done():
+                st.caption("Computing wave aggregates...")
+            elif waves.exception() is not None:
+                st.caption("N/A")
+            else:
+                st.dataframe(waves.result(), use_container_width=True)
+
+        self.progressive(render, [data, waves])
+
+    def layout(self):
+        import streamlit as st
+
+        st.title("Speed Dating Dataset")
+        tab1, tab2 = st.tabs(["Explore", "Dataset Summary"])
+        with tab1:
+            with st.sidebar:
+                st.button("Clear Selections", on_click=lambda: st.session_state.clear())
+                columns = st.columns(len(schema.list_groups()))
+                for ix, group in enumerate(schema.list_groups()):
+                    with columns[ix]:
+                        st.write(f"**{group.value}**")
+                        for col in schema.list_by_group(group.value):
+                            st.checkbox(col.name, key=col.name)
+            cols = [
+                key
+                for key in st.session_state.keys()
+                if st.session_state[key] is True and schema.exists(key)
+            ]
+            self.columns_panel(cols)
             # st.dataframe(self.app.dataset.data.select_dtypes("number").describe())
             # st.dataframe(self.app.dataset.data[cols].sample(10))
             st.divider()
@@ -110,43 +246,10 @@ class StreamlitApp:
             with ccol1:
                 st.write("### Histograms")
                 for col in cols:
-                    try:
-                        colname = schema.get_col_by_name(col).desc
-                    except AttributeError:
-                        colname = "N/A"
-
-                    st.write(f"#### {col} ({colname})")
-                    missing_count = self.app.data[col].isna().sum()
-                    total_count = len(self.app.data[col])
-                    bc1, bc2, bc3 = st.columns(3)
-                    with bc1:
-                        st.badge(f"Missing: {missing_count}", color="red")
-                    with bc2:
-                        st.badge(f"Total: {total_count}", color="blue")
-                    with bc3:
-                        st.badge(
-                            f"Missing %: {missing_count / total_count * 100:.2f}%",
-                            color="orange",
-                        )
-                    drop_nulls = st.checkbox(
-                        "Drop Nulls", value=True, key=f"drop_nulls_{col}"
-                    )
-                    st.write(drop_nulls)
-                    if drop_nulls:
-                        hist_data = self.app.data[col].dropna()
-                    else:
-                        hist_data = self.app.data[col]
-
-                    bar_chart_data = hist_data.value_counts()
-                    st.write(bar_chart_data)
-                    st.bar_chart(bar_chart_data, use_container_width=True)
+                    self.histogram_panel(col)
             with ccol2:
                 st.write("### Correlation Matrix")
-                corr = self.app.data[cols].corr()
-                st.dataframe(
-                    corr.style.background_gradient(cmap="coolwarm"),
-                    use_container_width=True,
-                )
+                self.correlation_panel(cols)
                 # st.metric("Cell 1-1", "$1.2M", "12%")
 
         with tab2:
@@ -157,8 +260,7 @@ class StreamlitApp:
             with c2:
                 st.write("### Some other filters")
                 st.checkbox("Show only categorical columns", key="categorical_only")
-            st.write("### Data Types")
-            st.dataframe(self.app.data.dtypes)
+            self.summary_panel()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,180 @@
+from functools import cached_property, lru_cache
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+import snax.umbd.spd.schema as schema
+from snax.datasets import load_pandas
+
+PAIR_COLUMNS = [
+    schema.col.wave.name,
+    schema.col.iid.name,
+    schema.col.pid.name,
+    schema.col.dec.name,
+    schema.col.dec_o.name,
+    schema.col.match.name,
+]
+
+
+def _rate(numerator, denominator):
+    numerator = np.asarray(numerator, dtype=float)
+    denominator = np.asarray(denominator, dtype=float)
+    return np.divide(
+        numerator,
+        denominator,
+        out=np.full_like(numerator, np.nan),
+        where=denominator > 0,
+    )
+
+
+class WaveGraph:
+    """Sparse participant x partner adjacency of a single speed dating wave.
+
+    Rows and columns index ``iids``. Each row of the dataset is one directed edge
+    ``iid -> pid``; ``yes`` holds ``dec``, ``yes_o`` holds ``dec_o`` and ``match``
+    holds ``match`` for that edge. Aggregates are computed once and cached.
+
+    :param wave: Wave number.
+    :param frame: Rows of the wave with at least ``PAIR_COLUMNS``.
+    """
+
+    def __init__(self, wave: int, frame: pd.DataFrame):
+        frame = frame.dropna(subset=PAIR_COLUMNS)
+        self.wave = wave
+        self.iids = np.unique(np.concatenate([frame["iid"], frame["pid"]]))
+        rows = np.searchsorted(self.iids, frame["iid"].to_numpy())
+        cols = np.searchsorted(self.iids, frame["pid"].to_numpy())
+        self.met = self._adjacency(np.ones(len(frame)), rows, cols)
+        self.yes = self._adjacency(frame["dec"].to_numpy(), rows, cols)
+        self.yes_o = self._adjacency(frame["dec_o"].to_numpy(), rows, cols)
+        self.match = self._adjacency(frame["match"].to_numpy(), rows, cols)
+        # Row-wise check needs no adjacency: match must equal dec & dec_o.
+        self._row_mismatches = int(
+            (
+                frame["match"].astype(bool)
+                != (frame["dec"].astype(bool) & frame["dec_o"].astype(bool))
+            ).sum()
+        )
+
+    def _adjacency(self, values, rows, cols) -> sparse.csr_array:
+        n = len(self.iids)
+        return sparse.csr_array(
+            (values.astype(np.int8), (rows, cols)), shape=(n, n), dtype=np.int8
+        )
+
+    def __repr__(self):
+        return f"WaveGraph(wave={self.wave!r}, participants={len(self.iids)}, pairs={self.met.nnz})"
+
+    @cached_property
+    def mirrored(self) -> sparse.csr_array:
+        """Edges whose mirrored row (``pid -> iid``) is also present."""
+        return self.met.multiply(self.met.T).tocsr()
+
+    @cached_property
+    def reciprocity(self) -> float:
+        """Share of yes decisions that were returned by the partner."""
+        mutual = self.yes.multiply(self.yes.T).sum()
+        return float(_rate(mutual, self.yes.sum()))
+
+    @cached_property
+    def match_rate(self) -> float:
+        return float(_rate(self.match.sum(), self.met.sum()))
+
+    @cached_property
+    def yes_rate(self) -> float:
+        return float(_rate(self.yes.sum(), self.met.sum()))
+
+    @cached_property
+    def participants(self) -> pd.DataFrame:
+        """Per-participant yes-rates given and received, and match counts.
+
+        Received decisions come from each row's own ``dec_o``, so they do not
+        depend on the partner's mirrored row being present.
+        """
+        dates = self.met.sum(axis=1)
+        yes_given = self.yes.sum(axis=1)
+        yes_received = self.yes_o.sum(axis=1)
+        return pd.DataFrame(
+            {
+                "wave": self.wave,
+                "iid": self.iids,
+                "dates": dates,
+                "yes_given": yes_given,
+                "yes_received": yes_received,
+                "yes_rate_given": _rate(yes_given, dates),
+                "yes_rate_received": _rate(yes_received, dates),
+                "matches": self.match.sum(axis=1),
+            }
+        )
+
+    @cached_property
+    def consistency(self) -> dict[str, int]:
+        """Number of edges violating each consistency rule.
+
+        - ``match``: ``match != dec & dec_o`` on the row itself.
+        - ``missing_mirror``: no ``pid -> iid`` row for an ``iid -> pid`` row.
+        - ``dec_o_mirror``: ``dec_o`` differs from the partner's ``dec``.
+        - ``match_mirror``: ``match`` differs between the two mirrored rows.
+        """
+        return {
+            "match": self._row_mismatches,
+            "missing_mirror": int(self.met.nnz - self.mirrored.nnz),
+            "dec_o_mirror": int(
+                (self.yes_o - self.yes.T).multiply(self.mirrored).count_nonzero()
+            ),
+            "match_mirror": int(
+                (self.match - self.match.T).multiply(self.mirrored).count_nonzero()
+            ),
+        }
+
+    def summary(self) -> dict:
+        return {
+            "wave": self.wave,
+            "participants": len(self.iids),
+            "pairs": self.met.nnz,
+            "yes_rate": self.yes_rate,
+            "reciprocity": self.reciprocity,
+            "match_rate": self.match_rate,
+            **{f"inconsistent_{key}": val for key, val in self.consistency.items()},
+        }
+
+
+class MatchGraph:
+    """Per-wave ``WaveGraph`` engine over a speed dating frame.
+
+    The frame is split by wave once; each ``WaveGraph`` is built on first access
+    and kept, so wave-level aggregates are computed only once.
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        self._frames = {
+            int(wave): frame
+            for wave, frame in data[PAIR_COLUMNS].groupby(schema.col.wave.name)
+        }
+        self._graphs: dict[int, WaveGraph] = {}
+
+    @property
+    def waves(self) -> list[int]:
+        return list(self._frames)
+
+    def wave(self, wave: int) -> WaveGraph:
+        if wave not in self._graphs:
+            if wave not in self._frames:
+                raise KeyError(f"No wave {wave!r} found.")
+            self._graphs[wave] = WaveGraph(wave, self._frames[wave])
+        return self._graphs[wave]
+
+    def summary(self) -> pd.DataFrame:
+        return pd.DataFrame([self.wave(wave).summary() for wave in self.waves])
+
+    def participants(self) -> pd.DataFrame:
+        return pd.concat(
+            [self.wave(wave).participants for wave in self.waves], ignore_index=True
+        )
+
+
+@lru_cache(maxsize=1)
+def match_graph() -> MatchGraph:
+    """``MatchGraph`` of the speed dating dataset, shared within the process."""
+    return MatchGraph(load_pandas(name="speed_dating", encoding="latin1"))
@@ -0,0 +1,128 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+
+from snax.analyze.main import Component
+from snax.datasets import load_pandas
+
+MAX_CORRELATIONS = 32
+RETRY_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class ColumnStats:
+    component: Component
+    samples: list
+
+
+def load_data():
+    return load_pandas(name="speed_dating", encoding="latin1")
+
+
+def profile_column(data: Future, name: str) -> ColumnStats:
+    series = data.result()[name]
+    component = Component(name, series)
+    component.process()
+    return ColumnStats(component, series.dropna().unique()[:5].tolist())
+
+
+def histogram(column: Future):
+    return column.result().component.histogram()
+
+
+def correlation(data: Future, names: tuple[str, ...]):
+    data = data.result()
+    return data[[name for name in names if name in data]].corr(numeric_only=True)
+
+
+def wave_summary(data: Future):
+    import snax.umbd.spd.matches as matches
+
+    return matches.MatchGraph(data.result()).summary()
+
+
+class Profiler:
+    """Profiles the speed dating dataset in background threads.
+
+    Every task is submitted once per key and its ``Future`` is kept, so callers
+    (e.g. Streamlit reruns) can poll ``done()`` and render whatever is ready.
+    The dataset is loaded by a single task that all other tasks wait on. It is
+    always submitted first, so it never queues behind a task waiting for it.
+
+    A failed task is resubmitted by the first ``submit`` at least
+    ``retry_seconds`` after its failure was first seen; the delay keeps a task that always fails
+    (e.g. a missing column) from being retried on every rerun. Correlation
+    tasks are keyed by the selected columns, so only the ``max_correlations``
+    most recently used ones are kept.
+
+    :param max_workers: Number of worker threads.
+    :param retry_seconds: Minimum delay before a failed task is retried.
+    :param max_correlations: Number of correlation tasks kept.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        retry_seconds: float = RETRY_SECONDS,
+        max_correlations: int = MAX_CORRELATIONS,
+    ):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="spd-profiler"
+        )
+        self._futures: dict[object, Future] = {}
+        self._correlations: OrderedDict[object, Future] = OrderedDict()
+        self._failed_at: dict[Future, float] = {}
+        self._lock = threading.Lock()
+        self.retry_seconds = retry_seconds
+        self.max_correlations = max_correlations
+
+    def submit(self, key, fn, *args) -> Future:
+        with self._lock:
+            return self._submit(self._futures, key, fn, *args)
+
+    def _submit(self, futures: dict, key, fn, *args) -> Future:
+        future = futures.get(key)
+        if future is None or self._retry(future):
+            future = futures[key] = self._executor.submit(fn, *args)
+        return future
+
+    def _retry(self, future: Future) -> bool:
+        if not future.done() or future.exception() is None:
+            return False
+        failed_at = self._failed_at.setdefault(future, time.monotonic())
+        if time.monotonic() - failed_at < self.retry_seconds:
+            return False
+        del self._failed_at[future]
+        return True
+
+    def data(self) -> Future:
+        return self.submit("data", load_data)
+
+    def column(self, name: str) -> Future:
+        return self.submit(("column", name), profile_column, self.data(), name)
+
+    def histogram(self, name: str) -> Future:
+        return self.submit(("histogram", name), histogram, self.column(name))
+
+    def correlation(self, names: list[str]) -> Future:
+        names = tuple(names)
+        data = self.data()
+        with self._lock:
+            future = self._submit(self._correlations, names, correlation, data, names)
+            self._correlations.move_to_end(names)
+            while len(self._correlations) > self.max_correlations:
+                self._failed_at.pop(self._correlations.popitem(last=False)[1], None)
+            return future
+
+    def waves(self) -> Future:
+        return self.submit("waves", wave_summary, self.data())
+
+
+@lru_cache(maxsize=1)
+def profiler() -> Profiler:
+    """Process-wide ``Profiler``; lives outside the Streamlit script so it
+    survives reruns."""
+    return Profiler()
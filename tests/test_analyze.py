@@ -0,0 +1,177 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from snax.analyze import analyze, analyze_chunks
+from snax.analyze.main import (
+    MAX_HIST_BINS,
+    Component,
+    histogram,
+    histogram_from_counts,
+)
+
+STATS = ["unique", "nunique", "min", "max", "mean", "median"]
+COUNTS = ["null_count", "non_null_count"]
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame(
+        {
+            "amount": rng.normal(100, 20, 1001),
+            "code": rng.integers(0, 5, 1001).astype(float),
+            "flag": rng.integers(0, 2, 1001).astype(bool),
+            "city": rng.choice(["a", "b", "c"], 1001),
+        }
+    )
+    data.loc[::7, "code"] = np.nan
+    data.loc[::11, "city"] = None
+    path = tmp_path / "data.csv"
+    data.to_csv(path, index=False)
+    return path
+
+
+def test_analyze_chunks_matches_analyze(csv_path):
+    expected = analyze(pd.read_csv(csv_path)).components
+    with pd.read_csv(csv_path, chunksize=150) as chunks:
+        result = analyze_chunks(chunks)
+
+    assert [key for key, _ in result] == [key for key, _ in expected]
+    for key, component in expected:
+        streamed = result.get_component(key)
+        for stat in COUNTS:
+            assert getattr(streamed, stat) == getattr(component, stat), (key, stat)
+        for stat in STATS:
+            assert getattr(streamed, stat) == pytest.approx(
+                getattr(component, stat), nan_ok=True
+            ), (key, stat)
+        if component.value_counts is not None:
+            assert streamed.value_counts.to_dict() == component.value_counts.to_dict()
+
+
+def test_analyze_chunks_quantiles(csv_path):
+    data = pd.read_csv(csv_path)
+    with pd.read_csv(csv_path, chunksize=150) as chunks:
+        result = analyze_chunks(chunks)
+    assert result.amount.quantiles().tolist() == pytest.approx(
+        data["amount"].quantile([0.25, 0.5, 0.75]).tolist()
+    )
+
+
+def test_analyze_chunks_sketches_high_cardinality(csv_path):
+    data = pd.read_csv(csv_path)
+    with pd.read_csv(csv_path, chunksize=150) as chunks:
+        result = analyze_chunks(chunks, max_distinct=100)
+
+    amount = result.amount
+    assert amount.unique is None
+    assert amount.non_null_count == len(data)
+    assert amount.min == data["amount"].min()
+    assert amount.max == data["amount"].max()
+    assert amount.mean == pytest.approx(data["amount"].mean())
+    assert amount.median == pytest.approx(data["amount"].median(), abs=0.5)
+    assert result.code.unique == 5
+
+
+def test_streamed_component_rejects_row_operations():
+    component = Component.from_value_counts("x", pd.Series([2, 1], index=[1.0, 2.0]))
+    with pytest.raises(ValueError):
+        component.sample()
+    with pytest.raises(ValueError):
+        component.boxplot()
+
+
+def test_streamed_bool_median():
+    counts = pd.Series([3, 1], index=[True, False])
+    component = Component.from_value_counts("flag", counts)
+    assert component.median == pd.Series([True, True, True, False]).median()
+
+
+def test_histogram_bins_continuous_columns():
+    series = pd.Series(np.random.default_rng(0).normal(size=5000))
+    hist = histogram("x", series)
+    assert hist.is_binned
+    assert len(hist.counts) <= MAX_HIST_BINS
+    assert hist.counts.index.is_monotonic_increasing
+    assert hist.counts.sum() == 5000
+
+
+def test_histogram_caps_bins():
+    series = pd.Series(np.arange(10_000, dtype=float))
+    hist = histogram("x", series, max_bins=10)
+    assert hist.is_binned
+    assert len(hist.counts) == 10
+
+
+def test_histogram_counts_discrete_codes():
+    series = pd.Series([3, 1, 2, 2, 1, 2])
+    hist = histogram("code", series)
+    assert not hist.is_binned
+    assert hist.counts.to_dict() == {1: 2, 2: 3, 3: 1}
+
+
+def test_histogram_folds_categorical_tail():
+    series = pd.Series(["a"] * 5 + ["b"] * 3 + [f"x{i}" for i in range(10)])
+    hist = histogram("city", series, max_bins=3)
+    assert hist.counts.to_dict() == {"a": 5, "b": 3, "Other": 10}
+
+
+def test_histogram_nulls():
+    series = pd.Series([1.0, 2.0, np.nan, 2.0, np.nan])
+    hist = histogram("x", series)
+    assert hist.null_count == 2
+    assert hist.total == 5
+    assert hist.to_series(dropna=True).sum() == 3
+    with_nulls = hist.to_series(dropna=False)
+    assert with_nulls.sum() == 5
+    assert with_nulls.iloc[-1] == 2 and np.isnan(with_nulls.index[-1])
+
+
+def test_histogram_non_finite_values():
+    values = np.r_[np.random.default_rng(0).normal(size=1000), [np.inf, -np.inf]]
+    hist = histogram("x", pd.Series(values))
+    assert hist.counts.sum() == 1002
+    assert hist.counts.index[0] == -np.inf and hist.counts.iloc[0] == 1
+    assert hist.counts.index[-1] == np.inf and hist.counts.iloc[-1] == 1
+
+
+def test_histogram_from_counts_weighted():
+    value_counts = pd.Series(np.full(200, 3), index=np.arange(200, dtype=float))
+    hist = histogram_from_counts("x", value_counts, null_count=4, max_bins=20)
+    assert hist.is_binned
+    assert len(hist.counts) == 20
+    assert hist.counts.sum() == 600
+    assert hist.total == 604
+
+    discrete = histogram_from_counts("code", pd.Series([2, 5], index=[1, 0]))
+    assert not discrete.is_binned
+    assert discrete.counts.to_dict() == {0: 5, 1: 2}
+
+
+def test_analyze_chunks_sketch_follows_monotonic_column():
+    n = 200_000
+    data = pd.DataFrame({"id": np.arange(n)})
+    chunks = (data.iloc[i : i + 20_000] for i in range(0, n, 20_000))
+    component = analyze_chunks(chunks, max_distinct=10_000).id
+
+    assert component.unique is None
+    assert component.min == 0 and component.max == n - 1
+    assert component.median == pytest.approx(data["id"].median(), rel=0.01)
+    assert component.quantiles().tolist() == pytest.approx(
+        data["id"].quantile([0.25, 0.5, 0.75]).tolist(), rel=0.01
+    )
+    hist = component.histogram()
+    assert hist.counts.sum() == n
+    assert hist.counts.max() < 2 * hist.counts.min()
+
+
+def test_analyze_chunks_mixed_chunk_dtypes(tmp_path):
+    path = tmp_path / "mixed.csv"
+    path.write_text("x\n1\n2\n3\n1\na\nb\n")
+    expected = analyze(pd.read_csv(path)).components.x
+    with pd.read_csv(path, chunksize=3) as chunks:
+        result = analyze_chunks(chunks).x
+
+    assert result.unique == expected.unique == 5
+    assert not result.is_numerical
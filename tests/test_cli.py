@@ -0,0 +1,101 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from snax.cli import expand_inputs, main, output_stems
+
+
+@pytest.fixture
+def extracts(tmp_path):
+    root = tmp_path / "extracts"
+    rng = np.random.default_rng(0)
+    for day in ("d1", "d2"):
+        (root / day).mkdir(parents=True)
+        pd.DataFrame({"amount": rng.normal(size=50), "qty": range(50)}).to_csv(
+            root / day / "orders.csv", index=False
+        )
+    (root / "d2" / "broken.csv").write_text("")
+    return root
+
+
+def run(*argv):
+    with pytest.raises(SystemExit) as exc:
+        main(["profile", *map(str, argv)])
+    return exc.value.code
+
+
+def test_expand_inputs_dedupes(extracts):
+    pattern = str(extracts / "*" / "orders.csv")
+    paths = expand_inputs([pattern, str(extracts / "d1" / "orders.csv")])
+    assert paths == [extracts / "d1" / "orders.csv", extracts / "d2" / "orders.csv"]
+
+
+def test_output_stems_mirror_inputs(extracts, tmp_path):
+    paths = [extracts / "d1" / "orders.csv", extracts / "d2" / "orders.csv"]
+    out = tmp_path / "out"
+    assert output_stems(paths, out) == {
+        paths[0]: out / "d1" / "orders",
+        paths[1]: out / "d2" / "orders",
+    }
+
+
+def test_output_stems_reject_collisions(tmp_path):
+    paths = [tmp_path / "orders.csv", tmp_path / "orders.pkl"]
+    with pytest.raises(ValueError):
+        output_stems(paths, tmp_path / "out")
+
+
+def test_profile_good_and_bad_inputs(extracts, tmp_path):
+    out = tmp_path / "out"
+    code = run(extracts / "*" / "*.csv", "-o", out, "-j", 2, "--chunksize", 20)
+
+    assert code == 1
+    assert sorted(p.relative_to(out).as_posix() for p in out.rglob("*.*")) == [
+        "d1/orders.profile.json",
+        "d2/orders.profile.json",
+    ]
+    result = json.loads((out / "d1" / "orders.profile.json").read_text())
+    data = pd.read_csv(extracts / "d1" / "orders.csv")
+    components = {c["key"]: c for c in result["components"]}
+    assert components["qty"]["non_null_count"] == 50
+    assert components["amount"]["mean"] == pytest.approx(data["amount"].mean())
+
+
+def test_profile_success(extracts, tmp_path):
+    out = tmp_path / "out"
+    code = run(extracts / "*" / "orders.csv", "-o", out, "-f", "csv")
+
+    assert code == 0
+    frame = pd.read_csv(out / "d2" / "orders.profile.csv")
+    assert frame["key"].tolist() == ["amount", "qty"]
+
+
+def test_profile_parquet_mixed_stats(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "flags.csv"
+    pd.DataFrame({"flag": [True, False, True], "n": [1, 2, 3]}).to_csv(
+        path, index=False
+    )
+    out = tmp_path / "out"
+
+    assert run(path, "-o", out, "-f", "parquet", "-j", 1) == 0
+    frame = pd.read_parquet(out / "flags.profile.parquet").set_index("key")
+    assert frame.loc["flag", "max"] == 1.0
+    assert frame.loc["n", "median"] == 2.0
+
+
+def test_profile_json_is_strict_for_whole_file_inputs(tmp_path):
+    path = tmp_path / "empty.pkl"
+    pd.DataFrame({"x": [np.nan, np.nan], "n": [1.0, np.inf]}).to_pickle(path)
+    out = tmp_path / "out"
+
+    assert run(path, "-o", out, "-j", 1) == 0
+    text = (out / "empty.profile.json").read_text()
+    components = {
+        c["key"]: c for c in json.loads(text, parse_constant=pytest.fail)["components"]
+    }
+    assert components["x"]["min"] is None
+    assert components["x"]["mean"] is None
+    assert components["n"]["max"] is None
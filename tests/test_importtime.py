@@ -0,0 +1,33 @@
+import pytest
+
+from snax.importtime import check, parse
+
+STDERR = """\
+import time: self [us] | cumulative | imported package
+import time:       113 |        113 |   sitecustomize
+import time:      3491 |      61993 | site
+import time:       253 |        253 |   snax
+import time:      1200 |       1200 |     pandas._libs
+import time:      2300 |       3500 |   pandas
+import time:       317 |       4070 | snax.kit
+"""
+
+
+def test_parse_cumulative_time():
+    timing = parse(STDERR, "snax.kit")
+    assert timing.module == "snax.kit"
+    assert timing.cumulative_ms == pytest.approx(4.07)
+
+
+def test_parse_imported_modules():
+    timing = parse(STDERR, "snax.kit")
+    assert {"snax", "pandas", "pandas._libs", "snax.kit"} <= timing.imported
+
+
+def test_parse_missing_module():
+    with pytest.raises(ValueError):
+        parse(STDERR, "snax.analyze")
+
+
+def test_import_time_budgets():
+    assert check() == []
@@ -0,0 +1,70 @@
+import pandas as pd
+import pytest
+
+from snax.umbd.spd.matches import MatchGraph
+
+# Participants 1 and 2 date 3 and 4; the 4 -> 2 row is missing.
+ROWS = [
+    # iid, pid, dec, dec_o, match
+    (1, 3, 1, 1, 1),
+    (3, 1, 1, 1, 1),
+    (1, 4, 1, 0, 0),
+    (4, 1, 0, 1, 0),
+    (2, 3, 0, 1, 0),
+    (3, 2, 1, 0, 0),
+    (2, 4, 0, 0, 0),
+]
+
+
+def frame(rows=ROWS, wave=1):
+    data = pd.DataFrame(rows, columns=["iid", "pid", "dec", "dec_o", "match"])
+    data.insert(0, "wave", wave)
+    data["pid"] = data["pid"].astype(float)
+    return data
+
+
+def test_wave_rates():
+    wave = MatchGraph(frame()).wave(1)
+    assert wave.reciprocity == pytest.approx(2 / 4)
+    assert wave.match_rate == pytest.approx(2 / 7)
+    assert wave.yes_rate == pytest.approx(4 / 7)
+
+
+def test_participants_received_uses_dec_o():
+    participants = MatchGraph(frame()).wave(1).participants.set_index("iid")
+    assert participants.loc[4, "yes_rate_received"] == 1.0
+    assert participants.loc[2, "yes_rate_received"] == 0.5
+    assert participants.loc[1, "yes_rate_given"] == 1.0
+    assert participants.loc[1, "matches"] == 1
+
+
+def test_consistency_clean():
+    assert MatchGraph(frame()).wave(1).consistency == {
+        "match": 0,
+        "missing_mirror": 1,
+        "dec_o_mirror": 0,
+        "match_mirror": 0,
+    }
+
+
+def test_consistency_violations():
+    rows = list(ROWS)
+    rows[5] = (3, 2, 1, 1, 0)  # dec_o disagrees with 2 -> 3, match with dec & dec_o
+    rows[1] = (3, 1, 1, 1, 0)  # match disagrees with the mirrored 1 -> 3 row
+    assert MatchGraph(frame(rows)).wave(1).consistency == {
+        "match": 2,
+        "missing_mirror": 1,
+        "dec_o_mirror": 1,
+        "match_mirror": 2,
+    }
+
+
+def test_summary_per_wave():
+    data = pd.concat([frame(wave=1), frame(wave=2)], ignore_index=True)
+    graph = MatchGraph(data)
+    summary = graph.summary()
+    assert summary["wave"].tolist() == [1, 2]
+    assert summary["participants"].tolist() == [4, 4]
+    assert graph.wave(2) is graph.wave(2)
+    with pytest.raises(KeyError):
+        graph.wave(3)
@@ -0,0 +1,63 @@
+import threading
+
+import pandas as pd
+import pytest
+
+import snax.umbd.spd.stats as stats
+
+FRAME = pd.DataFrame({"age": [21.0, 25.0, None, 30.0], "wave": [1, 1, 2, 2]})
+
+
+def test_tasks_wait_for_data(monkeypatch):
+    loaded = threading.Event()
+
+    def load_data():
+        loaded.wait(5)
+        return FRAME
+
+    monkeypatch.setattr(stats, "load_data", load_data)
+    profiler = stats.Profiler()
+    column = profiler.column("age")
+    hist = profiler.histogram("age")
+    assert not column.done() and not hist.done()
+    loaded.set()
+    assert column.result(5).component.null_count == 1
+    assert hist.result(5).total == 4
+    assert profiler.data() is profiler.data()
+
+
+def test_failed_tasks_are_retried(monkeypatch):
+    calls = []
+
+    def load_data():
+        calls.append(None)
+        if len(calls) == 1:
+            raise OSError("transient")
+        return FRAME
+
+    monkeypatch.setattr(stats, "load_data", load_data)
+    profiler = stats.Profiler(retry_seconds=0)
+    with pytest.raises(OSError):
+        profiler.column("age").result(5)
+    assert profiler.column("age").result(5).component.non_null_count == 3
+    assert len(calls) == 2
+
+
+def test_failed_tasks_wait_before_retry(monkeypatch):
+    monkeypatch.setattr(stats, "load_data", lambda: FRAME)
+    profiler = stats.Profiler(retry_seconds=60)
+    missing = profiler.column("missing")
+    with pytest.raises(KeyError):
+        missing.result(5)
+    assert profiler.column("missing") is missing
+
+
+def test_correlations_are_capped(monkeypatch):
+    monkeypatch.setattr(stats, "load_data", lambda: FRAME)
+    profiler = stats.Profiler(max_correlations=2)
+    first = profiler.correlation(["age", "wave"])
+    profiler.correlation(["age"])
+    assert profiler.correlation(["age", "wave"]) is first
+    profiler.correlation(["wave"])
+    assert list(profiler._correlations) == [("age", "wave"), ("wave",)]
+    assert first.result(5).shape == (2, 2)